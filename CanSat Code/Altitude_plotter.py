@@ -3,13 +3,17 @@ import serial
 ser = serial.Serial('COM3', 9600, timeout=1)
 print("Reading altitude data...\n")
 
+buf = bytearray()
 while True:
     try:
-        raw = ser.readline()
-        # Decode safely, ignore non-UTF characters
-        line = raw.decode('utf-8', errors='ignore').strip()
-        if line.startswith("ALT"):
-            print(line)
+        # Read whatever is waiting in one call instead of byte-by-byte readline()
+        buf += ser.read(max(1, ser.in_waiting))
+        while b'\n' in buf:
+            raw, _, buf = buf.partition(b'\n')
+            # Decode safely, ignore non-UTF characters
+            line = raw.decode('utf-8', errors='ignore').strip()
+            if line.startswith("ALT"):
+                print(line)
     except Exception as e:
         print("Error:", e)
         break
@@ -1,6 +1,10 @@
+import numpy as np
+
+
 def sea_level_pressure(pressure_hpa, altitude_m):
     """
     Calculate sea-level equivalent pressure from measured pressure and altitude.
+    Accepts scalars or arrays (e.g. a whole flight log) and broadcasts like NumPy.
 
     :param pressure_hpa: Measured pressure in hPa (hectopascals)
     :param altitude_m: Altitude above sea level in meters
@@ -12,13 +16,26 @@ def sea_level_pressure(pressure_hpa, altitude_m):
     exponent = 5.257   # Precomputed constant from gas equation
 
     # Convert measured pressure to Pa if needed
-    pressure_pa = pressure_hpa * 100
+    pressure_pa = np.asarray(pressure_hpa, dtype=float) * 100.0
 
     # Apply barometric formula
-    p0_pa = pressure_pa * ((1 - (L * altitude_m) / T0) ** -exponent)
+    factor = (1.0 - (L / T0) * np.asarray(altitude_m, dtype=float)) ** -exponent
+    p0_pa = pressure_pa * factor
 
     # Convert back to hPa for readability
-    return p0_pa / 100
+    p0_hpa = p0_pa / 100.0
+    return p0_hpa if p0_hpa.ndim else float(p0_hpa)
+
+
+def sea_level_pressure_batch(pressures, altitudes):
+    """
+    Sea-level equivalent pressure for a full altitude/pressure log in one vectorized pass.
+
+    :param pressures: Sequence of measured pressures in hPa
+    :param altitudes: Sequence of altitudes in meters (same length as pressures)
+    :return: NumPy array of sea-level equivalent pressures in hPa
+    """
+    return np.atleast_1d(sea_level_pressure(pressures, altitudes))
 
 
 if __name__ == "__main__":
@@ -16,13 +16,14 @@
 #
 # Angles are in degrees. Yaw=Z, Pitch=Y, Roll=X (applied ZYX).
 #
+import functools
 import math
 import time
 import json
 import re
 import threading
 from dataclasses import dataclass
-from typing import Optional, Tuple, Dict
+from typing import NamedTuple, Optional, Tuple, Dict
 
 import numpy as np
 import plotly.graph_objects as go
@@ -35,8 +36,27 @@ try:
 except Exception:
     HAS_SERIAL = False
 
+try:
+    import orjson  # optional: faster JSON line parsing
+    json_loads = orjson.loads
+except Exception:
+    json_loads = json.loads
+
+try:
+    from numba import njit  # optional: JIT-compiled rotation kernel
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
 
 # --------------------------- Utilities ---------------------------
+# Serial-line patterns, compiled once for the telemetry hot loop
+_YPR_RE = re.compile(r"YPR\s*:\s*([-+0-9.eE]+)\s*,\s*([-+0-9.eE]+)\s*,\s*([-+0-9.eE]+)")
+_VEL_RE = re.compile(r"VEL\s*:\s*([-+0-9.eE]+)")
+_ALT_RE = re.compile(r"ALT\s*:\s*([-+0-9.eE]+)")
+_SPLIT_RE = re.compile(r"[,\s]+")
+
+
 @dataclass
 class CanSatState:
     yaw: float = 0.0    # deg
@@ -47,8 +67,18 @@ class CanSatState:
     ts: float = 0.0     # epoch seconds
 
 
+_LAST_YPR = [None, None]  # [(yaw, pitch, roll), matrix] of the last call
+
+
 def zyx_rotation_matrix(yaw_deg: float, pitch_deg: float, roll_deg: float) -> np.ndarray:
-    """Return 3x3 rotation matrix for intrinsic Z (yaw) -> Y (pitch) -> X (roll)."""
+    """
+    Return 3x3 rotation matrix for intrinsic Z (yaw) -> Y (pitch) -> X (roll).
+    The last result is cached and returned again for identical angles, so the array is read-only.
+    """
+    key = (yaw_deg, pitch_deg, roll_deg)
+    if _LAST_YPR[0] == key:
+        return _LAST_YPR[1]
+
     z = math.radians(yaw_deg)
     y = math.radians(pitch_deg)
     x = math.radians(roll_deg)
@@ -57,53 +87,207 @@ def zyx_rotation_matrix(yaw_deg: float, pitch_deg: float, roll_deg: float) -> np
     cy, sy = math.cos(y), math.sin(y)
     cx, sx = math.cos(x), math.sin(x)
 
-    Rz = np.array([[cz, -sz, 0],
-                   [sz,  cz, 0],
-                   [ 0,   0, 1]], dtype=float)
-    Ry = np.array([[ cy, 0, sy],
-                   [  0, 1,  0],
-                   [-sy, 0, cy]], dtype=float)
-    Rx = np.array([[1,  0,   0],
-                   [0, cx, -sx],
-                   [0, sx,  cx]], dtype=float)
-    return Rz @ Ry @ Rx  # intrinsic ZYX
-
-
-def make_cylinder(R=0.033, H=0.115, n_theta=64, n_z=20) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Closed form of Rz @ Ry @ Rx (intrinsic ZYX); avoids building three 3x3 arrays per frame
+    r00 = cz * cy
+    r01 = cz * sy * sx - sz * cx
+    r02 = cz * sy * cx + sz * sx
+    r10 = sz * cy
+    r11 = sz * sy * sx + cz * cx
+    r12 = sz * sy * cx - cz * sx
+    r20 = -sy
+    r21 = cy * sx
+    r22 = cy * cx
+    Rm = np.array([[r00, r01, r02],
+                   [r10, r11, r12],
+                   [r20, r21, r22]], dtype=float)
+    Rm.flags.writeable = False
+    _LAST_YPR[0], _LAST_YPR[1] = key, Rm
+    return Rm
+
+
+@st.cache_data(show_spinner=False)
+def make_cylinder(R=0.033, H=0.115, n_theta=40, n_z=20) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Generate a parametric cylinder surface (no end caps).
-    Returns X, Y, Z arrays shaped (n_z, n_theta).
+    Returns float32 X, Y, Z arrays shaped (n_z, n_theta). Cached across reruns.
     """
-    theta = np.linspace(0, 2*np.pi, n_theta)
-    z = np.linspace(-H/2, H/2, n_z)
+    theta = np.linspace(0, 2*np.pi, n_theta, dtype=np.float32)
+    z = np.linspace(-H/2, H/2, n_z, dtype=np.float32)
     T, Z = np.meshgrid(theta, z)
     X = R * np.cos(T)
     Y = R * np.sin(T)
     return X, Y, Z
 
 
-def rotate_points(X: np.ndarray, Y: np.ndarray, Z: np.ndarray, R: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-    """Apply 3x3 rotation to parametric surface points."""
-    pts = np.stack([X.ravel(), Y.ravel(), Z.ravel()], axis=0)  # (3, N)
-    rot = R @ pts
-    x = rot[0, :].reshape(X.shape)
-    y = rot[1, :].reshape(Y.shape)
-    z = rot[2, :].reshape(Z.shape)
-    return x, y, z
+@st.cache_data(show_spinner=False)
+def cylinder_points(R=0.033, H=0.115, n_theta=40, n_z=20) -> np.ndarray:
+    """Cylinder surface points pre-stacked as a (3, N) array. Cached across reruns."""
+    X, Y, Z = make_cylinder(R=R, H=H, n_theta=n_theta, n_z=n_z)
+    return np.stack([X.ravel(), Y.ravel(), Z.ravel()], axis=0)
 
 
-def parse_serial_line(s: str) -> Dict[str, float]:
+@st.cache_data(show_spinner=False)
+def scene_points(R=0.033, H=0.115, n_theta=40, n_z=20, L=0.08) -> np.ndarray:
+    """
+    Cylinder surface points followed by the body-frame X/Y/Z axis segments (origin, tip pairs),
+    stacked as a single (3, N + 6) array so the whole scene rotates in one matmul. Cached across reruns.
+    """
+    pts_surface = cylinder_points(R=R, H=H, n_theta=n_theta, n_z=n_z)
+    pts_axes = np.array([[0, L, 0, 0, 0, 0],
+                         [0, 0, 0, L, 0, 0],
+                         [0, 0, 0, 0, 0, L]], dtype=np.float32)
+    return np.concatenate([pts_surface, pts_axes], axis=1)
+
+
+def _rotate_cylinder(yaw_deg, pitch_deg, roll_deg, pts, out):
+    """
+    Rotate (3, N) points by the intrinsic ZYX matrix into out (3, N).
+    Same closed form as zyx_rotation_matrix, written as plain loops so Numba can compile it.
+    """
+    z = math.radians(yaw_deg)
+    y = math.radians(pitch_deg)
+    x = math.radians(roll_deg)
+
+    cz, sz = math.cos(z), math.sin(z)
+    cy, sy = math.cos(y), math.sin(y)
+    cx, sx = math.cos(x), math.sin(x)
+
+    r00 = cz * cy
+    r01 = cz * sy * sx - sz * cx
+    r02 = cz * sy * cx + sz * sx
+    r10 = sz * cy
+    r11 = sz * sy * sx + cz * cx
+    r12 = sz * sy * cx - cz * sx
+    r20 = -sy
+    r21 = cy * sx
+    r22 = cy * cx
+
+    for j in range(pts.shape[1]):
+        px, py, pz = pts[0, j], pts[1, j], pts[2, j]
+        out[0, j] = r00 * px + r01 * py + r02 * pz
+        out[1, j] = r10 * px + r11 * py + r12 * pz
+        out[2, j] = r20 * px + r21 * py + r22 * pz
+    return out
+
+
+def _rotate_cylinder_numpy(yaw_deg, pitch_deg, roll_deg, pts, out):
+    """NumPy fallback for _rotate_cylinder when Numba is not installed."""
+    Rm = zyx_rotation_matrix(yaw_deg, pitch_deg, roll_deg).astype(pts.dtype)
+    return np.matmul(Rm, pts, out=out)
+
+
+@st.cache_resource(show_spinner=False)
+def rotation_kernel():
+    """
+    Return rotate_cylinder(yaw, pitch, roll, pts, out). Uses Numba when available; the kernel is
+    compiled (or loaded from the on-disk cache) and warmed once per server process, not per rerun.
+    """
+    if not HAS_NUMBA:
+        return _rotate_cylinder_numpy
+    kernel = njit(cache=True, fastmath=True)(_rotate_cylinder)
+    kernel(0.0, 0.0, 0.0, np.zeros((3, 1), np.float32), np.empty((3, 1), np.float32))  # warm-up
+    return kernel
+
+
+def rotate_points(pts: np.ndarray, yaw_deg: float, pitch_deg: float, roll_deg: float,
+                  shape: Tuple[int, int], out: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Apply the ZYX rotation to stacked scene points (see scene_points), writing into out.
+    Returns surface x, y, z reshaped to the grid plus the rotated (3, 6) axis segments.
+    """
+    rot = rotation_kernel()(float(yaw_deg), float(pitch_deg), float(roll_deg), pts, out)
+    n = shape[0] * shape[1]
+    x = rot[0, :n].reshape(shape)
+    y = rot[1, :n].reshape(shape)
+    z = rot[2, :n].reshape(shape)
+    return x, y, z, rot[:, n:]
+
+
+def make_scene_figure() -> go.Figure:
+    """
+    Build the attitude figure once: cylinder surface, one trace with all three body axes
+    (NaN-separated segments, colored X/Y/Z = red/green/blue) and one trace with the axis labels,
+    plus the fixed scene layout and HUD annotations. Coordinates and text are filled in per frame.
+    """
+    surf = go.Surface(x=[], y=[], z=[], opacity=0.9, showscale=False)
+
+    axis_lines = go.Scatter3d(
+        x=[], y=[], z=[],
+        mode="lines",
+        line=dict(width=6, color=[0, 0, 0, 0.5, 0.5, 0.5, 1, 1], cmin=0, cmax=1,
+                  colorscale=[[0, "red"], [0.5, "green"], [1, "blue"]]),
+        name="axes",
+        showlegend=False
+    )
+    # Axis labels at the tips
+    axis_labels = go.Scatter3d(
+        x=[], y=[], z=[],
+        mode="text",
+        text=["X", "Y", "Z"],
+        textposition="top center",
+        showlegend=False
+    )
+
+    fig = go.Figure(data=[surf, axis_lines, axis_labels])
+    fig.update_scenes(
+        xaxis_title="X",
+        yaxis_title="Y",
+        zaxis_title="Z",
+        aspectmode="data",
+    )
+    fig.update_layout(
+        margin=dict(l=0, r=0, t=30, b=0),
+        title="",
+        scene=dict(
+            xaxis=dict(range=[-0.12, 0.12]),
+            yaxis=dict(range=[-0.12, 0.12]),
+            zaxis=dict(range=[-0.12, 0.12]),
+        ),
+        # SpaceX-style HUD annotations (paper coordinates); text is set per frame
+        annotations=[
+            dict(
+                x=0.01, y=0.02, xref="paper", yref="paper",
+                text="",
+                showarrow=False, font=dict(size=16)
+            ),
+            dict(
+                x=0.99, y=0.02, xref="paper", yref="paper",
+                text="",
+                showarrow=False, xanchor="right", font=dict(size=16)
+            ),
+        ],
+    )
+    return fig
+
+
+class ParsedLine(NamedTuple):
+    """Fields parsed from one serial line (immutable, so results can be shared from the cache)."""
+    yaw: float = 0.0
+    pitch: float = 0.0
+    roll: float = 0.0
+    vel: float = 0.0
+    alt: float = 0.0
+
+
+@functools.lru_cache(maxsize=512)
+def parse_serial_line(s: str) -> ParsedLine:
     """
     Parse a line into fields yaw, pitch, roll, vel, alt (floats). Missing fields default to 0.
     Supports three flexible formats shown at the top of the file.
+    Cached on the raw line: idle streams (on the pad, after recovery) repeat the same frame.
     """
+    return ParsedLine(**_parse_fields(s))
+
+
+def _parse_fields(s: str) -> Dict[str, float]:
+    """Uncached parser behind parse_serial_line; returns the fields as a dict."""
     s = s.strip()
     out = {"yaw": 0.0, "pitch": 0.0, "roll": 0.0, "vel": 0.0, "alt": 0.0}
 
     # Try JSON
     if s.startswith("{") and s.endswith("}"):
         try:
-            obj = json.loads(s)
+            obj = json_loads(s)
             for k in out:
                 if k in obj:
                     out[k] = float(obj[k])
@@ -112,17 +296,17 @@ def parse_serial_line(s: str) -> Dict[str, float]:
             pass
 
     # Try labeled pattern like YPR: a,b,c;VEL:v;ALT:a
-    m = re.search(r"YPR\s*:\s*([-+0-9.eE]+)\s*,\s*([-+0-9.eE]+)\s*,\s*([-+0-9.eE]+)", s)
+    m = _YPR_RE.search(s) if "YPR" in s else None
     if m:
         out["yaw"] = float(m.group(1)); out["pitch"] = float(m.group(2)); out["roll"] = float(m.group(3))
-        mv = re.search(r"VEL\s*:\s*([-+0-9.eE]+)", s)
-        ma = re.search(r"ALT\s*:\s*([-+0-9.eE]+)", s)
+        mv = _VEL_RE.search(s)
+        ma = _ALT_RE.search(s)
         if mv: out["vel"] = float(mv.group(1))
         if ma: out["alt"] = float(ma.group(1))
         return out
 
     # Try simple CSV yaw,pitch,roll,vel,alt
-    parts = [p for p in re.split(r"[,\s]+", s) if p]
+    parts = [p for p in _SPLIT_RE.split(s) if p]
     if len(parts) >= 3:
         try:
             out["yaw"] = float(parts[0]); out["pitch"] = float(parts[1]); out["roll"] = float(parts[2])
@@ -175,24 +359,27 @@ class SerialReader:
         self._ser = None
 
     def _run(self):
-        buff = b""
+        buff = bytearray()
         while not self._stop.is_set():
             try:
-                data = self._ser.readline()
-                if not data:
-                    continue
-                line = data.decode(errors="ignore").strip()
-                fields = parse_serial_line(line)
-                st_ = CanSatState(
-                    yaw=fields["yaw"],
-                    pitch=fields["pitch"],
-                    roll=fields["roll"],
-                    vel=fields["vel"],
-                    alt=fields["alt"],
-                    ts=time.time(),
-                )
-                with self._lock:
-                    self._latest = st_
+                # Read whatever is waiting in one call instead of byte-by-byte readline()
+                buff += self._ser.read(max(1, self._ser.in_waiting))
+                while b"\n" in buff:
+                    data, _, buff = buff.partition(b"\n")
+                    line = data.decode(errors="ignore").strip()
+                    if not line:
+                        continue
+                    fields = parse_serial_line(line)
+                    st_ = CanSatState(
+                        yaw=fields.yaw,
+                        pitch=fields.pitch,
+                        roll=fields.roll,
+                        vel=fields.vel,
+                        alt=fields.alt,
+                        ts=time.time(),
+                    )
+                    with self._lock:
+                        self._latest = st_
             except Exception:
                 # swallow parse/serial hiccups
                 pass
@@ -206,6 +393,9 @@ class SerialReader:
 
 
 # --------------------------- Streamlit App ---------------------------
+# Cylinder mesh resolution (n_theta, n_z) per "Mesh detail" level
+MESH_DETAIL = {"Low": (24, 12), "Medium": (40, 20), "High": (80, 40)}
+
 st.set_page_config(page_title="CanSat Live 3D", layout="wide")
 
 if "serial_reader" not in st.session_state:
@@ -214,6 +404,8 @@ if "auto_refresh" not in st.session_state:
     st.session_state.auto_refresh = True
 if "refresh_hz" not in st.session_state:
     st.session_state.refresh_hz = 10
+if "mesh_detail" not in st.session_state:
+    st.session_state.mesh_detail = "Medium"
 if "last_render" not in st.session_state:
     st.session_state.last_render = 0.0
 
@@ -239,7 +431,46 @@ with st.sidebar:
     st.subheader("Refresh")
     st.session_state.auto_refresh = st.toggle("Auto-refresh", value=st.session_state.auto_refresh, help="Continuously update the scene")
     st.session_state.refresh_hz = st.slider("Refresh rate (Hz)", min_value=1, max_value=30, value=st.session_state.refresh_hz)
-    st.caption("Tip: If performance dips, lower the refresh rate.")
+    st.session_state.mesh_detail = st.select_slider("Mesh detail", options=list(MESH_DETAIL), value=st.session_state.mesh_detail)
+    st.caption("Tip: If performance dips, lower the refresh rate or mesh detail.")
+
+
+def render_attitude(state: CanSatState) -> go.Figure:
+    """
+    Rotate the scene for state and patch the cached figure. If neither the telemetry sample (ts)
+    nor the mesh detail changed since the last frame, the cached figure is returned untouched.
+    """
+    n_theta, n_z = MESH_DETAIL[st.session_state.mesh_detail]
+    frame_key = (state.ts, n_theta, n_z)
+    fig = st.session_state.get("scene_fig")
+    if fig is not None and st.session_state.get("last_frame_key") == frame_key:
+        return fig
+
+    # Rotate cached cylinder (mesh is built once, only the rotation changes per frame)
+    pts = scene_points(R=0.033, H=0.115, n_theta=n_theta, n_z=n_z, L=0.08)  # surface + body-frame axes
+    buf = st.session_state.get("scene_buf")
+    if buf is None or buf.shape != pts.shape:
+        buf = st.session_state.scene_buf = np.empty_like(pts)
+    x, y, z, ax_rot = rotate_points(pts, state.yaw, state.pitch, state.roll, (n_z, n_theta), buf)
+
+    # Coordinate axes (body frame): (origin, tip) segments joined with NaN breaks, labels at the tips
+    ax_lines = np.insert(ax_rot, [2, 4], np.nan, axis=1)  # (3, 8)
+    ax_tips = ax_rot[:, 1::2]  # (3, 3)
+
+    # Reuse the figure across reruns; only trace coordinates and text change per frame
+    if fig is None:
+        fig = st.session_state.scene_fig = make_scene_figure()
+
+    fig.data[0].update(x=x, y=y, z=z)
+    fig.data[1].update(x=ax_lines[0], y=ax_lines[1], z=ax_lines[2])
+    fig.data[2].update(x=ax_tips[0], y=ax_tips[1], z=ax_tips[2])
+    fig.layout.title.text = f"Yaw {state.yaw:.1f}°, Pitch {state.pitch:.1f}°, Roll {state.roll:.1f}°"
+    fig.layout.annotations[0].text = f"VEL {state.vel:.1f} m/s"
+    fig.layout.annotations[1].text = f"ALT {state.alt:.1f} m"
+
+    st.session_state.last_frame_key = frame_key
+    return fig
+
 
 # Main layout
 col_left, col_right = st.columns([2, 1])
@@ -249,75 +480,8 @@ with col_left:
     st.subheader("Attitude Visualizer")
     # Get latest state (if no serial, will be zeros)
     state = sr.latest()
-
-    # Generate and rotate cylinder
-    X, Y, Z = make_cylinder(R=0.033, H=0.115, n_theta=80, n_z=40)
-    Rm = zyx_rotation_matrix(state.yaw, state.pitch, state.roll)
-    x, y, z = rotate_points(X, Y, Z, Rm)
-
-    # Coordinate axes (body frame)
-    L = 0.08  # axis length
-    axes = {
-        "X": (np.array([0, L, np.nan]), np.array([0, 0, np.nan]), np.array([0, 0, np.nan])),
-        "Y": (np.array([0, 0, np.nan]), np.array([0, L, np.nan]), np.array([0, 0, np.nan])),
-        "Z": (np.array([0, 0, np.nan]), np.array([0, 0, np.nan]), np.array([0, L, np.nan])),
-    }
-    # Rotate axes
-    for k in list(axes.keys()):
-        pts = np.vstack(axes[k])  # 3 x 3
-        rot = Rm @ pts
-        axes[k] = (rot[0, :], rot[1, :], rot[2, :])
-
-    surf = go.Surface(x=x, y=y, z=z, opacity=0.9, showscale=False)
-
-    axis_traces = []
-    for name, (xx, yy, zz) in axes.items():
-        axis_traces.append(go.Scatter3d(
-            x=xx, y=yy, z=zz,
-            mode="lines",
-            line=dict(width=6),
-            name=f"{name}-axis",
-            showlegend=False
-        ))
-        # Axis label at the end
-        axis_traces.append(go.Scatter3d(
-            x=[xx[1]], y=[yy[1]], z=[zz[1]],
-            mode="text",
-            text=[name],
-            textposition="top center",
-            showlegend=False
-        ))
-
-    fig = go.Figure(data=[surf] + axis_traces)
-    fig.update_scenes(
-        xaxis_title="X",
-        yaxis_title="Y",
-        zaxis_title="Z",
-        aspectmode="data",
-    )
-    fig.update_layout(
-        margin=dict(l=0, r=0, t=30, b=0),
-        title=f"Yaw {state.yaw:.1f}°, Pitch {state.pitch:.1f}°, Roll {state.roll:.1f}°",
-        scene=dict(
-            xaxis=dict(range=[-0.12, 0.12]),
-            yaxis=dict(range=[-0.12, 0.12]),
-            zaxis=dict(range=[-0.12, 0.12]),
-        ),
-        # SpaceX-style HUD annotations (paper coordinates)
-        annotations=[
-            dict(
-                x=0.01, y=0.02, xref="paper", yref="paper",
-                text=f"VEL {state.vel:.1f} m/s",
-                showarrow=False, font=dict(size=16)
-            ),
-            dict(
-                x=0.99, y=0.02, xref="paper", yref="paper",
-                text=f"ALT {state.alt:.1f} m",
-                showarrow=False, xanchor="right", font=dict(size=16)
-            ),
-        ],
-    )
-
+    fig = render_attitude(state)
+    # Always re-emit the chart: Streamlit drops elements that are not written during a rerun
     st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
 
 # Telemetry & controls
@@ -1,9 +1,19 @@
 import asyncio
 import json
+import struct
 import time
+import threading
 import serial
 import serial.tools.list_ports
 import websockets
+from urllib.parse import urlparse, parse_qs
+
+try:
+    import orjson  # optional: C JSON encoder for ?format=json clients
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode()  # str, so it still goes out as a text frame
+except ImportError:
+    json_dumps = json.dumps
 
 # ---------------- Serial Setup ----------------
 PORT = "COM3"     # Change to your Arduino/CanSat port
@@ -16,62 +26,119 @@ except Exception as e:
     print(f"❌ Could not open serial port: {e}")
     ser = None
 
+# ---------------- Telemetry Frame ----------------
+# Parsed samples are flat lists in FRAME_FIELDS order (ts last).
+# Binary frame (default), little-endian, 44 bytes:
+#   9 x float32: alt, temp, pres, acc_x, acc_y, acc_z, yaw_x, yaw_y, yaw_z  (offsets 0..32)
+#   1 x float64: ts                                                        (offset 36)
+# Browser side: const v = new DataView(evt.data); v.getFloat32(0, true) ... v.getFloat64(36, true)
+# Connect with ws://host:8765/?format=json to receive the JSON dicts instead (handy for debugging).
+FRAME_FIELDS = ("alt", "temp", "pres", "acc_x", "acc_y", "acc_z", "yaw_x", "yaw_y", "yaw_z", "ts")
+_PACKER = struct.Struct("<9fd")
+
 # ---------------- Serial Parser ----------------
+_KEY_INDEX = {"A": 0, "T": 1, "P": 2, "X": 3, "Y": 4, "Z": 5, "YX": 6, "YY": 7, "YZ": 8}
+_ZEROS = [0.0] * (len(FRAME_FIELDS) - 1)
+_scratch = [0.0] * len(FRAME_FIELDS)
+
 def parse_serial_line(line: str):
-    """Parse telemetry lines like: Data: A-450; T-27.5; X-5"""
-    out = {
-        "alt": 0.0, "temp": 0.0, "pres": 0.0,
-        "acc_x": 0.0, "acc_y": 0.0, "acc_z": 0.0,
-        "yaw_x": 0.0, "yaw_y": 0.0, "yaw_z": 0.0,
-        "ts": time.time()
-    }
+    """Parse telemetry lines like: Data: A-450; T-27.5; X-5
+    Returns a list ordered like FRAME_FIELDS. The same list is reused (overwritten) on every call,
+    so encode it before parsing the next line."""
+    out = _scratch
+    out[:-1] = _ZEROS
+    out[-1] = time.time()
     if not line.startswith("Data:"):
         return out
     parts = [p.strip() for p in line[5:].split(";") if p.strip()]
     for p in parts:
         if "-" not in p: continue
         key, val = p.split("-", 1)
-        try: val = float(val)
-        except: val = 0.0
-        if key == "A": out["alt"] = val
-        elif key == "T": out["temp"] = val
-        elif key == "P": out["pres"] = val
-        elif key == "X": out["acc_x"] = val
-        elif key == "Y": out["acc_y"] = val
-        elif key == "Z": out["acc_z"] = val
-        elif key == "YX": out["yaw_x"] = val
-        elif key == "YY": out["yaw_y"] = val
-        elif key == "YZ": out["yaw_z"] = val
+        i = _KEY_INDEX.get(key)
+        if i is None: continue
+        try: out[i] = float(val)
+        except: out[i] = 0.0
     return out
 
+def encode_frame(values, fmt):
+    """Serialize one parsed sample for a client using fmt ("binary" or "json")"""
+    if fmt == "json":
+        return json_dumps(dict(zip(FRAME_FIELDS, values)))
+    return _PACKER.pack(*values)
+
 # ---------------- WebSocket Server ----------------
-clients = set()
+CLIENT_QUEUE_SIZE = 64  # frames buffered per client before the oldest is dropped
+LOG_EVERY = 100         # print one status line per this many frames sent
+
+client_queues = {}  # queue -> frame format for that client
 
 async def telemetry_server(websocket, path):
-    print("🔗 Client connected")
-    clients.add(websocket)
+    """Forward frames from this client's queue; a slow client only ever delays itself."""
+    fmt = parse_qs(urlparse(path).query).get("format", ["binary"])[0]
+    fmt = "json" if fmt == "json" else "binary"
+    print(f"🔗 Client connected ({fmt})")
+    q = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+    client_queues[q] = fmt
     try:
         while True:
-            await asyncio.sleep(0.1)
+            msg = await q.get()
+            await websocket.send(msg)
     except websockets.exceptions.ConnectionClosed:
         print("❌ Client disconnected")
     finally:
-        clients.remove(websocket)
+        client_queues.pop(q, None)
+
+def broadcast(data):
+    """Queue data for every client without waiting; full queues drop their oldest frame.
+    Each frame format is encoded at most once per sample."""
+    payloads = {}
+    for q, fmt in client_queues.items():
+        msg = payloads.get(fmt)
+        if msg is None:
+            msg = payloads[fmt] = encode_frame(data, fmt)
+        if q.full():
+            q.get_nowait()
+        q.put_nowait(msg)
+
+def read_serial_chunks(loop, chunks):
+    """Blocking serial reads on a worker thread; each chunk is handed to the event loop as it arrives"""
+    while True:
+        try:
+            data = ser.read(ser.in_waiting or 1)  # waits up to the port timeout for the first byte
+        except Exception as e:
+            print(f"[Serial Error] {e}")
+            time.sleep(0.5)
+            continue
+        if data:
+            loop.call_soon_threadsafe(chunks.put_nowait, data)
 
 async def serial_reader():
-    """Read serial and broadcast to WebSocket clients"""
+    """Read serial (off the event loop) and broadcast each complete line to WebSocket clients"""
+    if not ser:
+        await asyncio.Future()  # no serial port: just keep the WebSocket server up
+
+    chunks = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+    threading.Thread(target=read_serial_chunks, args=(loop, chunks), daemon=True).start()
+
+    buf = bytearray()
+    sent = 0
     while True:
-        if ser and ser.in_waiting:
+        buf += await chunks.get()
+        while b"\n" in buf:
+            raw, _, buf = buf.partition(b"\n")
+            line = raw.decode("utf-8", errors="ignore").strip()
+            if not line:
+                continue
             try:
-                line = ser.readline().decode("utf-8", errors="ignore").strip()
-                if line:
-                    data = parse_serial_line(line)
-                    msg = json.dumps(data)
-                    print("➡️ Sending:", msg)
-                    await asyncio.gather(*(c.send(msg) for c in clients))
+                data = parse_serial_line(line)
+                broadcast(data)
             except Exception as e:
                 print(f"[Serial Error] {e}")
-        await asyncio.sleep(0.05)
+                continue
+            sent += 1
+            if sent % LOG_EVERY == 0:
+                print(f"➡️ Sent {sent} frames, latest:", dict(zip(FRAME_FIELDS, data)))
 
 async def main():
     server = await websockets.serve(telemetry_server, "0.0.0.0", 8765)
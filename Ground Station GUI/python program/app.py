@@ -1,28 +1,30 @@
 import streamlit as st
 import serial
 import threading
-import time
+from collections import deque
 import pandas as pd
 import plotly.express as px
+from streamlit_autorefresh import st_autorefresh
 
 # ---------------- USER CONFIG ----------------
 PORT = "COM13"  # Change this to your ESP32 port
 BAUDRATE = 115200
 REFRESH_INTERVAL = 1  # seconds
+MAX_POINTS = 5000  # samples kept per series (older ones are dropped)
+RAW_LINES_SHOWN = 20  # raw serial lines kept for the debug panel
 # ---------------------------------------------
 
 # ---------------- SESSION STATE ----------------
 if "data" not in st.session_state:
     st.session_state.data = {
-        "TI": [], "T": [], "P": [], "A": [],
-        "YX": [], "YY": [], "YZ": []
+        k: deque(maxlen=MAX_POINTS) for k in ("TI", "T", "P", "A", "YX", "YY", "YZ")
     }
 if "serial_thread_started" not in st.session_state:
     st.session_state.serial_thread_started = False
 if "serial_error" not in st.session_state:
     st.session_state.serial_error = None
 if "raw_lines" not in st.session_state:
-    st.session_state.raw_lines = []
+    st.session_state.raw_lines = deque(maxlen=RAW_LINES_SHOWN)
 
 # ---------------- SERIAL THREAD ----------------
 def read_serial():
@@ -74,16 +76,15 @@ placeholder_debug = st.expander("🛠️ Debug Serial Data", expanded=False)
 # ---------------- LIVE UPDATE ----------------
 def update_dashboard():
     data = st.session_state.data
+    latest = {k: (v[-1] if v else None) for k, v in data.items()}
 
     # Live values
     latest_values = {
-        "TI": data["TI"][-1] if data["TI"] else "—",
-        "Temperature (T)": data["T"][-1] if data["T"] else "—",
-        "Pressure (P)": data["P"][-1] if data["P"] else "—",
-        "Altitude (A)": data["A"][-1] if data["A"] else "—",
-        "Yaw YX": data["YX"][-1] if data["YX"] else "—",
-        "Yaw YY": data["YY"][-1] if data["YY"] else "—",
-        "Yaw YZ": data["YZ"][-1] if data["YZ"] else "—",
+        label: ("—" if latest[k] is None else latest[k])
+        for label, k in (
+            ("TI", "TI"), ("Temperature (T)", "T"), ("Pressure (P)", "P"), ("Altitude (A)", "A"),
+            ("Yaw YX", "YX"), ("Yaw YY", "YY"), ("Yaw YZ", "YZ"),
+        )
     }
     placeholder_values.json(latest_values)
 
@@ -95,7 +96,7 @@ def update_dashboard():
         with col1:
             if data["TI"] and data["T"]:
                 fig = px.line(
-                    x=data["TI"], y=data["T"],
+                    x=list(data["TI"]), y=list(data["T"]),
                     labels={"x": "TI", "y": "Temperature (°C)"},
                     title="Temperature vs TI"
                 )
@@ -104,7 +105,7 @@ def update_dashboard():
         with col2:
             if data["TI"] and data["P"]:
                 fig = px.line(
-                    x=data["TI"], y=data["P"],
+                    x=list(data["TI"]), y=list(data["P"]),
                     labels={"x": "TI", "y": "Pressure"},
                     title="Pressure vs TI"
                 )
@@ -113,7 +114,7 @@ def update_dashboard():
         with col3:
             if data["TI"] and data["A"]:
                 fig = px.line(
-                    x=data["TI"], y=data["A"],
+                    x=list(data["TI"]), y=list(data["A"]),
                     labels={"x": "TI", "y": "Altitude"},
                     title="Altitude vs TI"
                 )
@@ -124,9 +125,9 @@ def update_dashboard():
         st.subheader("🛰️ CanSat Orientation (Yaw)")
         if data["YX"] and data["YY"] and data["YZ"]:
             yaw_df = pd.DataFrame({
-                "x": [0, data["YX"][-1]],
-                "y": [0, data["YY"][-1]],
-                "z": [0, data["YZ"][-1]],
+                "x": [0, latest["YX"]],
+                "y": [0, latest["YY"]],
+                "z": [0, latest["YZ"]],
             })
             fig = px.line_3d(yaw_df, x="x", y="y", z="z", title="Yaw Orientation")
             st.plotly_chart(fig, use_container_width=True)
@@ -135,13 +136,11 @@ def update_dashboard():
 
     # Debug raw serial
     with placeholder_debug:
-        st.write(st.session_state.raw_lines[-20:])  # show last 20 lines
+        st.write(list(st.session_state.raw_lines))  # last RAW_LINES_SHOWN lines
         if st.session_state.serial_error:
             st.error(st.session_state.serial_error)
 
-# Auto-refresh the dashboard every REFRESH_INTERVAL seconds
-st_autorefresh = st.experimental_data_editor([], key="dummy")  # dummy to force Streamlit to refresh
+# Auto-refresh the dashboard every REFRESH_INTERVAL seconds (rerun is scheduled client-side)
+st_autorefresh(interval=REFRESH_INTERVAL * 1000, key="dashboard_refresh")
 
 update_dashboard()
-time.sleep(REFRESH_INTERVAL)
-st.experimental_rerun()
\ No newline at end of file
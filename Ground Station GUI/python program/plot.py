@@ -1,5 +1,7 @@
 import os
 import ast
+import json
+import pandas as pd
 import matplotlib.pyplot as plt
 
 # ---------------- USER CONFIG ----------------
@@ -13,27 +15,50 @@ file_path = os.path.join("Launch_Data", f"Launch{LAUNCH_NUMBER}.my_format")
 plots_folder = os.path.join("Plots", f"Launch{LAUNCH_NUMBER}")
 os.makedirs(plots_folder, exist_ok=True)
 
-# Storage for values
-TI, T, P, A = [], [], [], []
+def load_records(path):
+    """
+    Load all launch records into a DataFrame.
+    Records are JSON lines (one dict per line, as written by receiver.py);
+    older launch files written with str(dict) are parsed line by line instead.
+    """
+    with open(path, "r") as f:
+        first = next((line.strip() for line in f if line.strip()), "")
+    if not first:
+        return pd.DataFrame()
 
-# Read file and parse dicts
-with open(file_path, "r") as f:
-    for line in f:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            record = ast.literal_eval(line)  # safely convert str -> dict
+    try:
+        json.loads(first)
+    except ValueError:
+        # Legacy format: python dict repr per line
+        records = []
+        with open(path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(ast.literal_eval(line))  # safely convert str -> dict
+                except Exception as e:
+                    print("⚠️ Skipping line due to error:", e)
+        return pd.DataFrame(records)
 
-            if "TI" in record:
-                TI.append(int(record["TI"]))
-                # keep other lists aligned
-                T.append(float(record["T"]) if "T" in record else None)
-                P.append(float(record["P"]) if "P" in record else None)
-                A.append(float(record["A"]) if "A" in record else None)
+    return pd.read_json(path, lines=True, dtype=False)
 
-        except Exception as e:
-            print("⚠️ Skipping line due to error:", e)
+# Read file, keep only records with a TI
+df = load_records(file_path)
+if "TI" in df:
+    df = df[pd.to_numeric(df["TI"], errors="coerce").notna()]
+else:
+    df = pd.DataFrame(columns=["TI"])
+
+def column(name):
+    """Numeric column aligned with TI (NaN where the field is missing)."""
+    if name in df:
+        return pd.to_numeric(df[name], errors="coerce")
+    return pd.Series(float("nan"), index=df.index)
+
+TI = pd.to_numeric(df["TI"]).astype(int).to_numpy()
+T, P, A = column("T"), column("P"), column("A")
 
 # Utility to plot & save
 def plot_and_save(x, y, xlabel, ylabel, title, filename):
@@ -48,14 +73,14 @@ def plot_and_save(x, y, xlabel, ylabel, title, filename):
     plt.close()
     print("✅ Saved:", save_path)
 
-# Plot graphs (skip None values)
-if any(v is not None for v in T):
-    plot_and_save(TI, [v for v in T if v is not None], "TI", "Temperature (T)", "Temperature vs TI", "T_vs_TI.png")
+# Plot graphs (missing values show as gaps)
+if T.notna().any():
+    plot_and_save(TI, T.to_numpy(), "TI", "Temperature (T)", "Temperature vs TI", "T_vs_TI.png")
 
-if any(v is not None for v in P):
-    plot_and_save(TI, [v for v in P if v is not None], "TI", "Pressure (P)", "Pressure vs TI", "P_vs_TI.png")
+if P.notna().any():
+    plot_and_save(TI, P.to_numpy(), "TI", "Pressure (P)", "Pressure vs TI", "P_vs_TI.png")
 
-if any(v is not None for v in A):
-    plot_and_save(TI, [v for v in A if v is not None], "TI", "Altitude (A)", "Altitude vs TI", "A_vs_TI.png")
+if A.notna().any():
+    plot_and_save(TI, A.to_numpy(), "TI", "Altitude (A)", "Altitude vs TI", "A_vs_TI.png")
 
 print("🎉 All plots saved in:", plots_folder)
\ No newline at end of file
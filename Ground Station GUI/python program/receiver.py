@@ -23,6 +23,13 @@ if not os.path.exists(file_path):
 # Open serial connection
 ser = serial.Serial(PORT, BAUDRATE, timeout=1)
 
+# Token key -> (target group, field name)
+_FIELD_MAP = {
+    "A": ("data", "A"), "T": ("data", "T"), "P": ("data", "P"),
+    "X": ("accel", "X"), "Y": ("accel", "Y"), "Z": ("accel", "Z"),
+    "YX": ("yaw", "YX"), "YY": ("yaw", "YY"), "YZ": ("yaw", "YZ"),
+}
+
 def parse_data(line):
     """
     Parse incoming line like:
@@ -34,30 +41,18 @@ def parse_data(line):
 
     accel = {"Category": "Accelerometer"}
     yaw = {"Category": "Yaw"}
+    groups = {"data": data_dict, "accel": accel, "yaw": yaw}
 
     for p in parts:
         if p.startswith("CAN-"):
             key_val = p.split("-")
             if len(key_val) >= 3 and key_val[1] == "TI":
                 data_dict["TI"] = key_val[2]
-        elif p.startswith("A-"):
-            data_dict["A"] = p.split("-")[1]
-        elif p.startswith("T-"):
-            data_dict["T"] = p.split("-")[1]
-        elif p.startswith("P-"):
-            data_dict["P"] = p.split("-")[1]
-        elif p.startswith("X-"):
-            accel["X"] = p.split("-")[1]
-        elif p.startswith("Y-"):
-            accel["Y"] = p.split("-")[1]
-        elif p.startswith("Z-"):
-            accel["Z"] = p.split("-")[1]
-        elif p.startswith("YX-"):
-            yaw["YX"] = p.split("-")[1]
-        elif p.startswith("YY-"):
-            yaw["YY"] = p.split("-")[1]
-        elif p.startswith("YZ-"):
-            yaw["YZ"] = p.split("-")[1]
+            continue
+        k, _, v = p.partition("-")
+        target = _FIELD_MAP.get(k)
+        if target:
+            groups[target[0]][target[1]] = v
 
     # ✅ Only return record if meaningful fields exist
     if any(k in data_dict for k in ["TI", "A", "T", "P"]):
@@ -70,26 +65,43 @@ def parse_data(line):
 
 print(f"Listening on {PORT} at {BAUDRATE} baud...")
 
-while True:
-    try:
-        line = ser.readline().decode("utf-8").strip()
-        if not line:
-            continue
-
-        print("Received:", line)
-        record = parse_data(line)
-
-        if record:  # ✅ Only append valid data
-            with open(file_path, "a") as f:
-                f.write(str(record)+"\n")
-
-
-            print("✅ Data appended to", file_path)
-        else:
-            print("⏭️ Skipped invalid/empty line")
-
-    except KeyboardInterrupt:
-        print("\nStopped by user.")
-        break
-    except Exception as e:
-        print("⚠️ Error:", e)
\ No newline at end of file
+# Keep the log open for the whole session; flush every FLUSH_EVERY records
+FLUSH_EVERY = 50
+log_fp = open(file_path, "a", buffering=1 << 16)
+pending = 0
+
+buf = bytearray()
+try:
+    while True:
+        try:
+            # Read whatever is waiting in one call instead of byte-by-byte readline()
+            buf += ser.read(max(1, ser.in_waiting))
+            while b"\n" in buf:
+                raw, _, buf = buf.partition(b"\n")
+                line = raw.decode("utf-8").strip()
+                if not line:
+                    continue
+
+                print("Received:", line)
+                record = parse_data(line)
+
+                if record:  # ✅ Only append valid data
+                    log_fp.write(json.dumps(record))
+                    log_fp.write("\n")
+                    pending += 1
+                    if pending >= FLUSH_EVERY:
+                        log_fp.flush()
+                        pending = 0
+
+                    print("✅ Data appended to", file_path)
+                else:
+                    print("⏭️ Skipped invalid/empty line")
+
+        except KeyboardInterrupt:
+            print("\nStopped by user.")
+            break
+        except Exception as e:
+            print("⚠️ Error:", e)
+finally:
+    log_fp.flush()
+    log_fp.close()